@@ -35,6 +35,8 @@ datas += [('gam/meet-v2beta.json', '.')]
 datas += [('gam/serviceaccountlookup-v1.json', '.')]
 hiddenimports = [
      'gam.gamlib.yubikey',
+     'smtplib',
+     'sqlite3',
      ]
 
 excludes = [
@@ -46,6 +46,7 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formatdate
 from email.policy import SMTP as policySMTP
+import functools
 import hashlib
 from html.entities import name2codepoint
 from html.parser import HTMLParser
@@ -67,9 +68,7 @@ import re
 from secrets import SystemRandom
 import shlex
 import signal
-import smtplib
 import socket
-import sqlite3
 import ssl
 import string
 import struct
@@ -124,6 +123,7 @@ import googleapiclient
 import googleapiclient.discovery
 import googleapiclient.errors
 import googleapiclient.http
+import googleapiclient.model
 import httplib2
 
 httplib2.RETRIES = 5
@@ -564,6 +564,9 @@ class LazyLoader(types.ModuleType):
     return dir(module)
 
 yubikey = LazyLoader('yubikey', globals(), 'gam.gamlib.yubikey')
+# Standard library modules used by only a few commands
+smtplib = LazyLoader('smtplib', globals(), 'smtplib')
+sqlite3 = LazyLoader('sqlite3', globals(), 'sqlite3')
 
 # gam yubikey resetpvi [yubikey_serialnumber <String>]
 def doResetYubiKeyPIV():
@@ -4414,6 +4417,8 @@ def SetGlobalVariables():
     os.environ['HTTPLIB2_CA_CERTS'] = GC.Values[GC.CACERTS_PEM]
     os.environ['SSL_CERT_FILE'] = GC.Values[GC.CACERTS_PEM]
     httplib2.CA_CERTS = GC.Values[GC.CACERTS_PEM]
+    if GC.Values[GC.USE_ORJSON]:
+      enableOrjson()
 # Needs to be set so oauthlib doesn't puke when Google changes our scopes
     os.environ['OAUTHLIB_RELAX_TOKEN_SCOPE'] = 'true'
 # Set up command logging at top level only
@@ -4431,6 +4436,25 @@ def handleServerError(e):
   writeStderr(Msg.DISABLE_TLS_MIN_MAX)
   systemErrorExit(NETWORK_ERROR_RC, None)
 
+# Decode Google API responses with orjson when it is installed; googleapiclient.model only calls json.loads
+# on response content, all other json functions are left as is
+def enableOrjson():
+  try:
+    import orjson # pylint: disable=import-outside-toplevel
+  except ImportError:
+    return
+  def _loads(s, **kwargs):
+    try:
+      return orjson.loads(s)
+# orjson rejects some content that json accepts, e.g. lone surrogate escapes in Drive/Gmail names
+    except orjson.JSONDecodeError:
+      return json.loads(s, **kwargs)
+
+  jsonShim = types.ModuleType('json')
+  jsonShim.__dict__.update(json.__dict__)
+  jsonShim.loads = _loads
+  googleapiclient.model.json = jsonShim
+
 def getHttpObj(cache=None, timeout=None, override_min_tls=None, override_max_tls=None):
   tls_minimum_version = override_min_tls if override_min_tls else GC.Values[GC.TLS_MIN_VERSION] if GC.Values[GC.TLS_MIN_VERSION] else None
   tls_maximum_version = override_max_tls if override_max_tls else GC.Values[GC.TLS_MAX_VERSION] if GC.Values[GC.TLS_MAX_VERSION] else None
@@ -4482,6 +4506,17 @@ class transportAuthorizedHttp(google_auth_httplib2.AuthorizedHttp):
     """Inserts the GAM user-agent header in requests."""
     return super().request(*args, **kwargs)
 
+# Close and drop the connections of an httplib2.Http (or AuthorizedHttp) after a transport error,
+# keeping the Http object and its connection dictionary for reuse
+def clearHttpConnections(httpObj):
+  connections = httpObj.connections
+  for conn in connections.values():
+    try:
+      conn.close()
+    except OSError:
+      pass
+  connections.clear()
+
 def transportCreateRequest(httpObj=None):
   """Creates a uniform Request object with a default http, if not provided.
 
@@ -4857,15 +4892,23 @@ def getClientCredentials(forceRefresh=False, forceWrite=False, filename=None, ap
           handleOAuthTokenError(e, False)
   return credentials
 
-def waitOnFailure(n, triesLimit, error_code, error_message):
-  delta = min(2 ** n, 60)+float(random.randint(1, 1000))/1000
+# Jittered exponential backoff: delay is chosen randomly between half and all of retry_base*2**n, capped at retry_max
+def waitOnFailure(n, triesLimit, error_code, error_message, retryAfter=0.0):
+  ceiling = min(GC.Values[GC.API_CALLS_RETRY_BASE]*2**n, GC.Values[GC.API_CALLS_RETRY_MAX])
+  delta = max(random.uniform(ceiling/2, ceiling), retryAfter)
   if n > 3:
-    writeStderr(f'Temporary error: {error_code} - {error_message}, Backing off: {int(delta)} seconds, Retry: {n}/{triesLimit}\n')
+    writeStderr(f'Temporary error: {error_code} - {error_message}, Backing off: {delta:.1f} seconds, Retry: {n}/{triesLimit}\n')
     flushStderr()
   time.sleep(delta)
   if GC.Values[GC.SHOW_API_CALLS_RETRY_DATA]:
     incrAPICallsRetryData(error_message, delta)
 
+def getRetryAfter(e):
+  try:
+    return min(float(e.resp.get('retry-after', 0)), GC.Values[GC.API_CALLS_RETRY_MAX])
+  except (AttributeError, TypeError, ValueError):
+    return 0.0
+
 def clearServiceCache(service):
   if hasattr(service._http, 'http') and hasattr(service._http.http, 'cache'):
     if service._http.http.cache is None:
@@ -4928,7 +4971,7 @@ def getService(api, httpObj):
         systemErrorExit(SOCKET_ERROR_RC, errMsg)
       except (httplib2.HttpLib2Error, google.auth.exceptions.TransportError, RuntimeError) as e:
         if n != triesLimit:
-          httpObj.connections = {}
+          clearHttpConnections(httpObj)
           waitOnFailure(n, triesLimit, NETWORK_ERROR_RC, str(e))
           continue
         handleServerError(e)
@@ -5260,14 +5303,18 @@ def writeGotMessage(msg):
   if GC.Values[GC.SHOW_GETTINGS_GOT_NL]:
     writeStderr(msg)
   else:
-    writeStderr('\r')
     msgLen = len(msg)
-    if msgLen < GM.Globals[GM.LAST_GOT_MSG_LEN]:
-      writeStderr(msg+' '*(GM.Globals[GM.LAST_GOT_MSG_LEN]-msgLen))
-    else:
-      writeStderr(msg)
+    writeStderr('\r'+msg+' '*(GM.Globals[GM.LAST_GOT_MSG_LEN]-msgLen))
     GM.Globals[GM.LAST_GOT_MSG_LEN] = msgLen
   flushStderr()
+  GM.Globals[GM.LAST_GOT_MSG_TIME] = time.monotonic()
+
+# Minimum seconds between overwritten (\r) Got messages for intermediate pages
+GOT_MSG_INTERVAL = 0.1
+
+def showGotMessageForPage(lastPage):
+  return (lastPage or GC.Values[GC.SHOW_GETTINGS_GOT_NL] or
+          time.monotonic()-GM.Globals[GM.LAST_GOT_MSG_TIME] >= GOT_MSG_INTERVAL)
 
 def callGDataPages(service, function,
                    pageMessage=None,
@@ -5503,14 +5550,14 @@ def callGAPI(service, function,
     retryReasons = []
   if triesLimit == 0:
     triesLimit = GC.Values[GC.API_CALLS_TRIES_LIMIT]
-  allRetryReasons = GAPI.DEFAULT_RETRY_REASONS+retryReasons
-  method = getattr(service, function)
-  svcparms = dict(list(kwargs.items())+GM.Globals[GM.EXTRA_ARGS_LIST])
+# function may be a method already resolved from service by the caller, e.g. when paging
+  method = getattr(service, function) if isinstance(function, str) else function
+  kwargs.update(GM.Globals[GM.EXTRA_ARGS_LIST])
   if GC.Values[GC.API_CALLS_RATE_CHECK]:
     checkAPICallsRate()
   for n in range(1, triesLimit+1):
     try:
-      return method(**svcparms).execute()
+      return method(**kwargs).execute()
     except googleapiclient.errors.HttpError as e:
       http_status, reason, message = checkGAPIError(e, softErrors=softErrors, retryOnHttpError=n < 3, mapNotFound=mapNotFound)
       if http_status == -1:
@@ -5518,27 +5565,28 @@ def callGAPI(service, function,
         # We'll refresh credentials and make another pass
         try:
 #          service._http.credentials.refresh(getHttpObj())
-          service._http.credentials.refresh(transportCreateRequest())
+          service._http.credentials.refresh(transportCreateRequest(service._http.http))
         except TypeError:
           systemErrorExit(HTTP_ERROR_RC, message)
         continue
       if http_status == 0:
         return None
-      if (n != triesLimit) and ((reason in allRetryReasons) or
+      if (n != triesLimit) and ((reason in GAPI.DEFAULT_RETRY_REASONS_SET) or (reason in retryReasons) or
                              (GC.Values[GC.RETRY_API_SERVICE_NOT_AVAILABLE] and (reason == GAPI.SERVICE_NOT_AVAILABLE))):
         if (reason in [GAPI.INTERNAL_ERROR, GAPI.BACKEND_ERROR] and
             bailOnInternalError and n == GC.Values[GC.BAIL_ON_INTERNAL_ERROR_TRIES]):
           raise GAPI.REASON_EXCEPTION_MAP[reason](message)
-        if (reason in [GAPI.INVALID] and
+        if (reason == GAPI.INVALID and
             bailOnInvalidError and n == GC.Values[GC.BAIL_ON_INTERNAL_ERROR_TRIES]):
           raise GAPI.REASON_EXCEPTION_MAP[reason](message)
-        waitOnFailure(n, triesLimit, reason, message)
+        waitOnFailure(n, triesLimit, reason, message, retryAfter=getRetryAfter(e))
         if reason == GAPI.TRANSIENT_ERROR and bailOnTransientError:
           raise GAPI.REASON_EXCEPTION_MAP[reason](message)
         continue
       if reason in throwReasons:
-        if reason in GAPI.REASON_EXCEPTION_MAP:
-          raise GAPI.REASON_EXCEPTION_MAP[reason](message)
+        reasonException = GAPI.REASON_EXCEPTION_MAP.get(reason)
+        if reasonException is not None:
+          raise reasonException(message)
         raise e
       if softErrors:
         stderrErrorMsg(f'{http_status}: {reason} - {message}{["", ": Giving up."][n > 1]}')
@@ -5550,7 +5598,7 @@ def callGAPI(service, function,
       raise e
     except (httplib2.HttpLib2Error, google.auth.exceptions.TransportError, RuntimeError) as e:
       if n != triesLimit:
-        service._http.connections = {}
+        clearHttpConnections(service._http)
         waitOnFailure(n, triesLimit, NETWORK_ERROR_RC, str(e))
         continue
       handleServerError(e)
@@ -5575,45 +5623,46 @@ def callGAPI(service, function,
     except TypeError as e:
       systemErrorExit(GOOGLE_API_ERROR_RC, str(e))
 
-def _showGAPIpagesResult(results, pageItems, totalItems, pageMessage, messageAttribute, entityType):
-  showMessage = pageMessage.replace(TOTAL_ITEMS_MARKER, str(totalItems))
-  if pageItems:
-    if messageAttribute:
-      firstItem = results[0] if pageItems > 0 else {}
-      lastItem = results[-1] if pageItems > 1 else firstItem
-      if isinstance(messageAttribute, str):
-        firstItem = str(firstItem.get(messageAttribute, ''))
-        lastItem = str(lastItem.get(messageAttribute, ''))
-      else:
-        for attr in messageAttribute:
-          firstItem = firstItem.get(attr, {})
-          lastItem = lastItem.get(attr, {})
-        firstItem = str(firstItem)
-        lastItem = str(lastItem)
-      showMessage = showMessage.replace(FIRST_ITEM_MARKER, firstItem)
-      showMessage = showMessage.replace(LAST_ITEM_MARKER, lastItem)
-  else:
-    showMessage = showMessage.replace(FIRST_ITEM_MARKER, '')
-    showMessage = showMessage.replace(LAST_ITEM_MARKER, '')
-  writeGotMessage(showMessage.replace('{0}', str(Ent.Choose(entityType, totalItems))))
+# Convert a page message with markers to a format string, done once per distinct page message
+@functools.lru_cache(maxsize=32)
+def _getPageMessageTemplate(pageMessage):
+  return (pageMessage.replace('{', '{{').replace('}', '}}').replace('{{0}}', '{entity}')
+          .replace(TOTAL_ITEMS_MARKER, '{total}').replace(FIRST_ITEM_MARKER, '{first}').replace(LAST_ITEM_MARKER, '{last}'))
 
-def _processGAPIpagesResult(results, items, allResults, totalItems, pageMessage, messageAttribute, entityType):
+# Convert a message attribute, a key or a list of nested keys, to a function that returns its value from an item
+def _getMessageAttributeFunction(messageAttribute):
+  if not messageAttribute:
+    return None
+  if isinstance(messageAttribute, str):
+    return lambda item: str(item.get(messageAttribute, ''))
+  attrPath = tuple(messageAttribute)
+  def _getAttributeValue(item):
+    for attr in attrPath:
+      item = item.get(attr, {})
+    return str(item)
+  return _getAttributeValue
+
+def _showGAPIpagesResult(results, pageItems, totalItems, pageMessage, getAttributeValue, entityType):
+  firstItem = lastItem = ''
+  if pageItems and getAttributeValue is not None:
+    firstItem = getAttributeValue(results[0])
+    lastItem = getAttributeValue(results[-1])
+  writeGotMessage(_getPageMessageTemplate(pageMessage).format_map({'total': totalItems, 'first': firstItem, 'last': lastItem,
+                                                                   'entity': Ent.Choose(entityType, totalItems)}))
+
+def _processGAPIpagesResult(results, items, extendResults, totalItems, pageMessage, getAttributeValue, entityType, maxItems=0):
   if results:
     pageToken = results.get('nextPageToken')
-    if items in results:
-      pageItems = len(results[items])
-      totalItems += pageItems
-      if allResults is not None:
-        allResults.extend(results[items])
-    else:
-      results = {items: []}
-      pageItems = 0
+    pageResults = results.get(items, [])
   else:
     pageToken = None
-    results = {items: []}
-    pageItems = 0
-  if pageMessage:
-    _showGAPIpagesResult(results[items], pageItems, totalItems, pageMessage, messageAttribute, entityType)
+    pageResults = []
+  pageItems = len(pageResults)
+  totalItems += pageItems
+  if extendResults is not None and pageItems:
+    extendResults(pageResults)
+  if pageMessage and showGotMessageForPage(not pageToken or (maxItems and totalItems >= maxItems)):
+    _showGAPIpagesResult(pageResults, pageItems, totalItems, pageMessage, getAttributeValue, entityType)
   return (pageToken, totalItems)
 
 def _finalizeGAPIpagesResult(pageMessage):
@@ -5658,24 +5707,37 @@ def callGAPIpages(service, function, items,
   totalItems = 0
   maxArg, maxResults = _setMaxArgResults(maxItems, pageArgsInBody, kwargs)
   entityType = Ent.Getting() if pageMessage else None
+  getAttributeValue = _getMessageAttributeFunction(messageAttribute) if pageMessage else None
+  extendResults = allResults.extend
+  method = getattr(service, function)
+  pageArgs = kwargs['body'] if pageArgsInBody else kwargs
   while True:
     if maxArg and maxItems-totalItems < maxResults:
-      if not pageArgsInBody:
-        kwargs[maxArg] = maxItems-totalItems
-      else:
-        kwargs['body'][maxArg] = maxItems-totalItems
-    results = callGAPI(service, function,
+      pageArgs[maxArg] = maxItems-totalItems
+    results = callGAPI(service, method,
                        throwReasons=throwReasons, retryReasons=retryReasons,
                        **kwargs)
-    pageToken, totalItems = _processGAPIpagesResult(results, items, allResults, totalItems, pageMessage, messageAttribute, entityType)
-    if not pageToken or (maxItems and totalItems >= maxItems):
+    if results:
+      pageToken = results.get('nextPageToken')
+      pageResults = results.get(items, [])
+    else:
+      pageToken = None
+      pageResults = []
+# Single page with nothing accumulated and nothing to show, return its items directly as callGAPIitems does
+    if not pageToken and not pageMessage and not allResults:
+      return pageResults
+    pageItems = len(pageResults)
+    totalItems += pageItems
+    if pageItems:
+      extendResults(pageResults)
+    lastPage = not pageToken or (maxItems and totalItems >= maxItems)
+    if pageMessage and showGotMessageForPage(lastPage):
+      _showGAPIpagesResult(pageResults, pageItems, totalItems, pageMessage, getAttributeValue, entityType)
+    if lastPage:
       if not noFinalize:
         _finalizeGAPIpagesResult(pageMessage)
       return allResults
-    if not pageArgsInBody:
-      kwargs['pageToken'] = pageToken
-    else:
-      kwargs['body']['pageToken'] = pageToken
+    pageArgs['pageToken'] = pageToken
 
 def yieldGAPIpages(service, function, items,
                    pageMessage=None, messageAttribute=None, maxItems=0, noFinalize=False,
@@ -5689,38 +5751,32 @@ def yieldGAPIpages(service, function, items,
   totalItems = 0
   maxArg, maxResults = _setMaxArgResults(maxItems, pageArgsInBody, kwargs)
   entityType = Ent.Getting() if pageMessage else None
+  getAttributeValue = _getMessageAttributeFunction(messageAttribute) if pageMessage else None
+  method = getattr(service, function)
+  pageArgs = kwargs['body'] if pageArgsInBody else kwargs
   while True:
     if maxArg and maxItems-totalItems < maxResults:
-      if not pageArgsInBody:
-        kwargs[maxArg] = maxItems-totalItems
-      else:
-        kwargs['body'][maxArg] = maxItems-totalItems
-    results = callGAPI(service, function,
+      pageArgs[maxArg] = maxItems-totalItems
+    results = callGAPI(service, method,
                        throwReasons=throwReasons, retryReasons=retryReasons,
                        **kwargs)
     if results:
       pageToken = results.get('nextPageToken')
-      if items in results:
-        pageItems = len(results[items])
-        totalItems += pageItems
-      else:
-        results = {items: []}
-        pageItems = 0
+      pageResults = results.get(items, [])
     else:
       pageToken = None
-      results = {items: []}
-      pageItems = 0
-    if pageMessage:
-      _showGAPIpagesResult(results[items], pageItems, totalItems, pageMessage, messageAttribute, entityType)
-    yield results[items]
-    if not pageToken or (maxItems and totalItems >= maxItems):
+      pageResults = []
+    pageItems = len(pageResults)
+    totalItems += pageItems
+    lastPage = not pageToken or (maxItems and totalItems >= maxItems)
+    if pageMessage and showGotMessageForPage(lastPage):
+      _showGAPIpagesResult(pageResults, pageItems, totalItems, pageMessage, getAttributeValue, entityType)
+    yield pageResults
+    if lastPage:
       if not noFinalize:
         _finalizeGAPIpagesResult(pageMessage)
       return
-    if not pageArgsInBody:
-      kwargs['pageToken'] = pageToken
-    else:
-      kwargs['body']['pageToken'] = pageToken
+    pageArgs['pageToken'] = pageToken
 
 def callGAPIitems(service, function, items,
                   throwReasons=None, retryReasons=None,
@@ -5736,6 +5792,54 @@ def callGAPIitems(service, function, items,
     return results.get(items, [])
   return []
 
+BATCH_RETRY_HTTP_STATUSES = frozenset([403, 429])
+
+# Execute one round of batch requests, returns the requests to be retried and the last retryable reason/message
+def _executeGAPIbatchRound(service, requests, callback, retryReasons, lastTry):
+  def _callbackRetry(request_id, response, exception):
+    nonlocal reason, message
+    error = None
+    if exception is not None and not lastTry:
+      status = getattr(getattr(exception, 'resp', None), 'status', 0)
+      if status in BATCH_RETRY_HTTP_STATUSES or status >= 500:
+        error = checkGAPIError(exception, retryOnHttpError=True)
+        if error[1] in GAPI.DEFAULT_RETRY_REASONS_SET or error[1] in retryReasons:
+          retries.append((request_id, pending[request_id]))
+          _, reason, message = error
+          return
+    callback(request_id, response, exception, error)
+
+  pending = dict(requests)
+  retries = []
+  reason = message = None
+  batchSize = GC.Values[GC.BATCH_SIZE]
+  jcount = len(requests)
+  for bstart in range(0, jcount, batchSize):
+    dbatch = service.new_batch_http_request(callback=_callbackRetry)
+    for request_id, request in requests[bstart:bstart+batchSize]:
+      dbatch.add(request, request_id=request_id)
+    if bstart+batchSize < jcount:
+      executeBatch(dbatch)
+    else:
+      dbatch.execute()
+  return (retries, reason, message)
+
+# requests is a list of (request_id, HttpRequest); requests that fail with a retry reason
+# are resubmitted in a following round of batches, all other results are passed to callback
+# callback(request_id, response, exception, error): error is the (http_status, reason, message) already
+# parsed from exception by checkGAPIError, or None if the exception hasn't been parsed
+def callGAPIbatch(service, requests, callback,
+                  retryReasons=None, triesLimit=0):
+  if retryReasons is None:
+    retryReasons = []
+  if triesLimit == 0:
+    triesLimit = GC.Values[GC.API_CALLS_TRIES_LIMIT]
+  for n in range(1, triesLimit+1):
+    requests, reason, message = _executeGAPIbatchRound(service, requests, callback, retryReasons, n == triesLimit)
+    if not requests:
+      return
+    waitOnFailure(n, triesLimit, reason, message)
+
 def readDiscoveryFile(api_version):
   disc_filename = f'{api_version}.json'
   disc_file = os.path.join(GM.Globals[GM.GAM_PATH], disc_filename)
@@ -5804,7 +5908,7 @@ def buildGAPIServiceObject(api, user, i=0, count=0, displayError=True):
       return (userEmail, service)
     except (httplib2.HttpLib2Error, google.auth.exceptions.TransportError, RuntimeError) as e:
       if n != triesLimit:
-        httpObj.connections = {}
+        clearHttpConnections(httpObj)
         waitOnFailure(n, triesLimit, NETWORK_ERROR_RC, str(e))
         continue
       handleServerError(e)
@@ -9564,7 +9668,7 @@ def _getServerTLSUsed(location):
       return tls_ver, cipher_name
     except (httplib2.HttpLib2Error, RuntimeError) as e:
       if n != triesLimit:
-        httpObj.connections = {}
+        clearHttpConnections(httpObj)
         waitOnFailure(n, triesLimit, NETWORK_ERROR_RC, str(e))
         continue
       handleServerError(e)
@@ -18270,7 +18374,7 @@ def _batchMoveCrOSesToOrgUnit(cd, orgUnitPath, orgUnitId, i, count, items, quick
 
 def _batchMoveUsersToOrgUnit(cd, orgUnitPath, i, count, items, fromOrgUnitPath=None):
   _MOVE_USER_REASON_TO_MESSAGE_MAP = {GAPI.USER_NOT_FOUND: Msg.DOES_NOT_EXIST, GAPI.DOMAIN_NOT_FOUND: Msg.SERVICE_NOT_APPLICABLE, GAPI.FORBIDDEN: Msg.SERVICE_NOT_APPLICABLE}
-  def _callbackMoveUsersToOrgUnit(request_id, _, exception):
+  def _callbackMoveUsersToOrgUnit(request_id, _, exception, error):
     ri = request_id.splitlines()
     if exception is None:
       if not fromOrgUnitPath:
@@ -18278,7 +18382,7 @@ def _batchMoveUsersToOrgUnit(cd, orgUnitPath, i, count, items, fromOrgUnitPath=N
       else:
         entityModifierActionPerformed([Ent.ORGANIZATIONAL_UNIT, fromOrgUnitPath, Ent.USER, ri[RI_ITEM]], toOrgUnitPath, int(ri[RI_J]), int(ri[RI_JCOUNT]))
     else:
-      http_status, reason, message = checkGAPIError(exception)
+      http_status, reason, message = error if error is not None else checkGAPIError(exception)
       errMsg = getHTTPError(_MOVE_USER_REASON_TO_MESSAGE_MAP, http_status, reason, message)
       if not fromOrgUnitPath:
         entityActionFailedWarning([Ent.ORGANIZATIONAL_UNIT, orgUnitPath, Ent.USER, ri[RI_ITEM]], errMsg, int(ri[RI_J]), int(ri[RI_JCOUNT]))
@@ -18294,21 +18398,14 @@ def _batchMoveUsersToOrgUnit(cd, orgUnitPath, i, count, items, fromOrgUnitPath=N
   Ind.Increment()
   svcargs = dict([('userKey', None), ('body', {'orgUnitPath': orgUnitPath}), ('fields', '')]+GM.Globals[GM.EXTRA_ARGS_LIST])
   method = getattr(cd.users(), 'update')
-  dbatch = cd.new_batch_http_request(callback=_callbackMoveUsersToOrgUnit)
-  bcount = 0
+  requests = []
   j = 0
   for user in items:
     j += 1
     svcparms = svcargs.copy()
     svcparms['userKey'] = normalizeEmailAddressOrUID(user)
-    dbatch.add(method(**svcparms), request_id=batchRequestID('', 0, 0, j, jcount, svcparms['userKey']))
-    bcount += 1
-    if bcount >= GC.Values[GC.BATCH_SIZE]:
-      executeBatch(dbatch)
-      dbatch = cd.new_batch_http_request(callback=_callbackMoveUsersToOrgUnit)
-      bcount = 0
-  if bcount > 0:
-    dbatch.execute()
+    requests.append((batchRequestID('', 0, 0, j, jcount, svcparms['userKey']), method(**svcparms)))
+  callGAPIbatch(cd, requests, _callbackMoveUsersToOrgUnit)
   Ind.Decrement()
 
 def _doUpdateOrgs(entityList):
@@ -32016,7 +32113,7 @@ def doPrintCIDevices():
       entityActionFailedWarning([entityType, None], str(e))
       continue
     if getDeviceUsers:
-      ci._http.credentials.refresh(transportCreateRequest())
+      ci._http.credentials.refresh(transportCreateRequest(ci._http.http))
       deviceDict = {}
       for device in devices:
         deviceDict[device['name']] = device
@@ -36528,8 +36625,10 @@ def doPrintGroups():
         entityActionFailedWarning([Ent.GROUP, ri[RI_ENTITY], ri[RI_ROLE], None], str(e), i, int(ri[RI_COUNT]))
         groupData[i]['required'] -= 1
         return
+    extendMembers = groupData[i][items].extend
+    getAttributeValue = _getMessageAttributeFunction('email')
     while True:
-      pageToken, totalItems = _processGAPIpagesResult(response, items, groupData[i][items], totalItems, pageMessage, 'email', ri[RI_ROLE])
+      pageToken, totalItems = _processGAPIpagesResult(response, items, extendMembers, totalItems, pageMessage, getAttributeValue, ri[RI_ROLE])
       if not pageToken:
         _finalizeGAPIpagesResult(pageMessage)
         break
@@ -50,6 +50,10 @@ ADMIN_EMAIL = 'admin_email'
 API_CALLS_RATE_CHECK = 'api_calls_rate_check'
 # API calls per 100 seconds limit
 API_CALLS_RATE_LIMIT = 'api_calls_rate_limit'
+# API calls retry backoff base delay in seconds
+API_CALLS_RETRY_BASE = 'api_calls_retry_base'
+# API calls retry backoff maximum delay in seconds
+API_CALLS_RETRY_MAX = 'api_calls_retry_max'
 # API calls tries limit
 API_CALLS_TRIES_LIMIT = 'api_calls_tries_limit'
 # Automatically generate gam batch command if number of users specified in gam users xxx command exceeds this number
@@ -318,6 +322,8 @@ UPDATE_CROS_OU_WITH_ID = 'update_cros_ou_with_id'
 USE_CHAT_ADMIN_ACCESS = 'use_chat_admin_access'
 # Use course owner for course access
 USE_COURSE_OWNER_ACCESS = 'use_course_owner_access'
+# Use orjson, if installed, to decode Google API responses
+USE_ORJSON = 'use_orjson'
 # Use Project ID as Project Name and App Name
 USE_PROJECTID_AS_NAME = 'use_projectid_as_name'
 # When retrieving lists of Users from API, how many should be retrieved in each chunk
@@ -341,6 +347,8 @@ Defaults = {
   ADMIN_EMAIL: '',
   API_CALLS_RATE_CHECK: FALSE,
   API_CALLS_RATE_LIMIT: '100',
+  API_CALLS_RETRY_BASE: '1.0',
+  API_CALLS_RETRY_MAX: '60.0',
   API_CALLS_TRIES_LIMIT: '10',
   AUTO_BATCH_MIN: '0',
   BAIL_ON_INTERNAL_ERROR_TRIES: '2',
@@ -473,6 +481,7 @@ Defaults = {
   UPDATE_CROS_OU_WITH_ID: FALSE,
   USE_CHAT_ADMIN_ACCESS: FALSE,
   USE_COURSE_OWNER_ACCESS: FALSE,
+  USE_ORJSON: FALSE,
   USE_PROJECTID_AS_NAME: FALSE,
   USER_MAX_RESULTS: '500',
   USER_SERVICE_ACCOUNT_ACCESS_ONLY: FALSE,
@@ -515,6 +524,8 @@ VAR_INFO = {
   ADMIN_EMAIL: {VAR_TYPE: TYPE_STRING, VAR_ENVVAR: 'GA_ADMIN_EMAIL', VAR_LIMITS: (0, None)},
   API_CALLS_RATE_CHECK: {VAR_TYPE: TYPE_BOOLEAN},
   API_CALLS_RATE_LIMIT: {VAR_TYPE: TYPE_INTEGER, VAR_LIMITS: (50, None)},
+  API_CALLS_RETRY_BASE: {VAR_TYPE: TYPE_FLOAT, VAR_LIMITS: (0.1, 10.0)},
+  API_CALLS_RETRY_MAX: {VAR_TYPE: TYPE_FLOAT, VAR_LIMITS: (1.0, 300.0)},
   API_CALLS_TRIES_LIMIT: {VAR_TYPE: TYPE_INTEGER, VAR_LIMITS: (3, 30)},
   AUTO_BATCH_MIN: {VAR_TYPE: TYPE_INTEGER, VAR_ENVVAR: 'GAM_AUTOBATCH', VAR_LIMITS: (0, 100)},
   BAIL_ON_INTERNAL_ERROR_TRIES: {VAR_TYPE: TYPE_INTEGER, VAR_LIMITS: (1, 10)},
@@ -647,6 +658,7 @@ VAR_INFO = {
   UPDATE_CROS_OU_WITH_ID: {VAR_TYPE: TYPE_BOOLEAN},
   USE_CHAT_ADMIN_ACCESS: {VAR_TYPE: TYPE_BOOLEAN},
   USE_COURSE_OWNER_ACCESS: {VAR_TYPE: TYPE_BOOLEAN},
+  USE_ORJSON: {VAR_TYPE: TYPE_BOOLEAN},
   USE_PROJECTID_AS_NAME: {VAR_TYPE: TYPE_BOOLEAN},
   USER_MAX_RESULTS: {VAR_TYPE: TYPE_INTEGER, VAR_LIMITS: (1, 500)},
   USER_SERVICE_ACCOUNT_ACCESS_ONLY: {VAR_TYPE: TYPE_BOOLEAN},
@@ -135,6 +135,8 @@ HTTP_OBJECT = 'http'
 IS_ON_GCE = 'ogce'
 # Length of last Got message
 LAST_GOT_MSG_LEN = 'lgml'
+# Time of last Got message
+LAST_GOT_MSG_TIME = 'lgmt'
 # License SKUs
 LICENSE_SKUS = 'lsku'
 # Make Building ID/Name map
@@ -289,6 +291,7 @@ Globals = {
   HTTP_OBJECT: None,
   IS_ON_GCE: False,
   LAST_GOT_MSG_LEN: 0,
+  LAST_GOT_MSG_TIME: 0.0,
   LICENSE_SKUS: [],
   MAKE_BUILDING_ID_NAME_MAP: True,
   MAKE_ROLE_ID_NAME_MAP: True,
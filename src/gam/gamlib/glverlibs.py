@@ -32,6 +32,7 @@ GAM_VER_LIBS = [
   'google-auth',
   'lxml',
   'httplib2',
+  'orjson',
   'passlib',
   'pathvalidate',
   'pyscard',